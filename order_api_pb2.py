@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0forder_api.proto\x12\tmy_api.v1\x1a\x1bgoogle/protobuf/empty.proto\"O\n\x07Product\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\r\n\x05price\x18\x04 \x01(\x01\"\xaf\x02\n\x05Order\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\'\n\x06status\x18\x03 \x01(\x0e\x32\x17.my_api.v1.Order.Status\x12$\n\x05items\x18\x04 \x03(\x0b\x32\x15.my_api.v1.Order.Item\x12\x14\n\x0ctotal_amount\x18\x05 \x01(\x01\x1a\x44\n\x04Item\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\x12\x16\n\x0eprice_per_item\x18\x03 \x01(\x01\"X\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\x0b\n\x07SHIPPED\x10\x02\x12\r\n\tCOMPLETED\x10\x03\x12\r\n\tCANCELLED\x10\x04\"\x1e\n\rCountResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\"#\n\x0e\x45xportResponse\x12\x11\n\tjson_data\x18\x01 \x01(\t\"H\n\x14\x43reateProductRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\r\n\x05price\x18\x03 \x01(\x01\"\'\n\x11GetProductRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\"\\\n\x14UpdateProductRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\r\n\x05price\x18\x04 \x01(\x01\"*\n\x14\x44\x65leteProductRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\"(\n\x15\x44\x65leteProductResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x15\n\x13ListProductsRequest\"K\n\x12\x43reateOrderRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12$\n\x05items\x18\x02 \x03(\x0b\x32\x15.my_api.v1.Order.Item\"#\n\x0fGetOrderRequest\x12\x10\n\x08order_id\x18\x01 \x01(\t\"Y\n\x18UpdateOrderStatusRequest\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12+\n\nnew_status\x18\x02 \x01(\x0e\x32\x17.my_api.v1.Order.Status2\xfe\x03\n\x0eProductService\x12\x44\n\rCreateProduct\x12\x1f.my_api.v1.CreateProductRequest\x1a\x12.my_api.v1.Product\x12>\n\nGetProduct\x12\x1c.my_api.v1.GetProductRequest\x1a\x12.my_api.v1.Product\x12\x44\n\rUpdateProduct\x12\x1f.my_api.v1.UpdateProductRequest\x1a\x12.my_api.v1.Product\x12R\n\rDeleteProduct\x12\x1f.my_api.v1.DeleteProductRequest\x1a .my_api.v1.DeleteProductResponse\x12\x44\n\x0cListProducts\x12\x1e.my_api.v1.ListProductsRequest\x1a\x12.my_api.v1.Product0\x01\x12\x41\n\rCountProducts\x12\x16.google.protobuf.Empty\x1a\x18.my_api.v1.CountResponse\x12\x43\n\x0e\x45xportProducts\x12\x16.google.protobuf.Empty\x1a\x19.my_api.v1.ExportResponse2\xd8\x02\n\x0cOrderService\x12>\n\x0b\x43reateOrder\x12\x1d.my_api.v1.CreateOrderRequest\x1a\x10.my_api.v1.Order\x12\x38\n\x08GetOrder\x12\x1a.my_api.v1.GetOrderRequest\x1a\x10.my_api.v1.Order\x12J\n\x11UpdateOrderStatus\x12#.my_api.v1.UpdateOrderStatusRequest\x1a\x10.my_api.v1.Order\x12?\n\x0b\x43ountOrders\x12\x16.google.protobuf.Empty\x1a\x18.my_api.v1.CountResponse\x12\x41\n\x0c\x45xportOrders\x12\x16.google.protobuf.Empty\x1a\x19.my_api.v1.ExportResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0forder_api.proto\x12\tmy_api.v1\x1a\x1bgoogle/protobuf/empty.proto\"O\n\x07Product\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\r\n\x05price\x18\x04 \x01(\x01\"1\n\x0cProductBatch\x12!\n\x05items\x18\x01 \x03(\x0b\x32\x12.my_api.v1.Product\"\xaf\x02\n\x05Order\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\'\n\x06status\x18\x03 \x01(\x0e\x32\x17.my_api.v1.Order.Status\x12$\n\x05items\x18\x04 \x03(\x0b\x32\x15.my_api.v1.Order.Item\x12\x14\n\x0ctotal_amount\x18\x05 \x01(\x01\x1a\x44\n\x04Item\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\x12\x16\n\x0eprice_per_item\x18\x03 \x01(\x01\"X\n\x06Status\x12\x16\n\x12STATUS_UNSPECIFIED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\x0b\n\x07SHIPPED\x10\x02\x12\r\n\tCOMPLETED\x10\x03\x12\r\n\tCANCELLED\x10\x04\"\x1e\n\rCountResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\"H\n\x14\x43reateProductRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\r\n\x05price\x18\x03 \x01(\x01\"\'\n\x11GetProductRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\"\\\n\x14UpdateProductRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\r\n\x05price\x18\x04 \x01(\x01\"*\n\x14\x44\x65leteProductRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\"(\n\x15\x44\x65leteProductResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x15\n\x13ListProductsRequest\"K\n\x12\x43reateOrderRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12$\n\x05items\x18\x02 \x03(\x0b\x32\x15.my_api.v1.Order.Item\"#\n\x0fGetOrderRequest\x12\x10\n\x08order_id\x18\x01 \x01(\t\"Y\n\x18UpdateOrderStatusRequest\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12+\n\nnew_status\x18\x02 \x01(\x0e\x32\x17.my_api.v1.Order.Status2\xcd\x04\n\x0eProductService\x12\x44\n\rCreateProduct\x12\x1f.my_api.v1.CreateProductRequest\x1a\x12.my_api.v1.Product\x12>\n\nGetProduct\x12\x1c.my_api.v1.GetProductRequest\x1a\x12.my_api.v1.Product\x12\x44\n\rUpdateProduct\x12\x1f.my_api.v1.UpdateProductRequest\x1a\x12.my_api.v1.Product\x12R\n\rDeleteProduct\x12\x1f.my_api.v1.DeleteProductRequest\x1a .my_api.v1.DeleteProductResponse\x12I\n\x0cListProducts\x12\x1e.my_api.v1.ListProductsRequest\x1a\x17.my_api.v1.ProductBatch0\x01\x12\x41\n\rCountProducts\x12\x16.google.protobuf.Empty\x1a\x18.my_api.v1.CountResponse\x12>\n\x0e\x45xportProducts\x12\x16.google.protobuf.Empty\x1a\x12.my_api.v1.Product0\x01\x12M\n\x0eImportProducts\x12\x1f.my_api.v1.CreateProductRequest\x1a\x18.my_api.v1.CountResponse(\x01\x32\xd1\x02\n\x0cOrderService\x12>\n\x0b\x43reateOrder\x12\x1d.my_api.v1.CreateOrderRequest\x1a\x10.my_api.v1.Order\x12\x38\n\x08GetOrder\x12\x1a.my_api.v1.GetOrderRequest\x1a\x10.my_api.v1.Order\x12J\n\x11UpdateOrderStatus\x12#.my_api.v1.UpdateOrderStatusRequest\x1a\x10.my_api.v1.Order\x12?\n\x0b\x43ountOrders\x12\x16.google.protobuf.Empty\x1a\x18.my_api.v1.CountResponse\x12:\n\x0c\x45xportOrders\x12\x16.google.protobuf.Empty\x1a\x10.my_api.v1.Order0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,36 +34,36 @@ if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_PRODUCT']._serialized_start=59
   _globals['_PRODUCT']._serialized_end=138
-  _globals['_ORDER']._serialized_start=141
-  _globals['_ORDER']._serialized_end=444
-  _globals['_ORDER_ITEM']._serialized_start=286
-  _globals['_ORDER_ITEM']._serialized_end=354
-  _globals['_ORDER_STATUS']._serialized_start=356
-  _globals['_ORDER_STATUS']._serialized_end=444
-  _globals['_COUNTRESPONSE']._serialized_start=446
-  _globals['_COUNTRESPONSE']._serialized_end=476
-  _globals['_EXPORTRESPONSE']._serialized_start=478
-  _globals['_EXPORTRESPONSE']._serialized_end=513
-  _globals['_CREATEPRODUCTREQUEST']._serialized_start=515
-  _globals['_CREATEPRODUCTREQUEST']._serialized_end=587
-  _globals['_GETPRODUCTREQUEST']._serialized_start=589
-  _globals['_GETPRODUCTREQUEST']._serialized_end=628
-  _globals['_UPDATEPRODUCTREQUEST']._serialized_start=630
-  _globals['_UPDATEPRODUCTREQUEST']._serialized_end=722
-  _globals['_DELETEPRODUCTREQUEST']._serialized_start=724
-  _globals['_DELETEPRODUCTREQUEST']._serialized_end=766
-  _globals['_DELETEPRODUCTRESPONSE']._serialized_start=768
-  _globals['_DELETEPRODUCTRESPONSE']._serialized_end=808
-  _globals['_LISTPRODUCTSREQUEST']._serialized_start=810
-  _globals['_LISTPRODUCTSREQUEST']._serialized_end=831
-  _globals['_CREATEORDERREQUEST']._serialized_start=833
-  _globals['_CREATEORDERREQUEST']._serialized_end=908
-  _globals['_GETORDERREQUEST']._serialized_start=910
-  _globals['_GETORDERREQUEST']._serialized_end=945
-  _globals['_UPDATEORDERSTATUSREQUEST']._serialized_start=947
-  _globals['_UPDATEORDERSTATUSREQUEST']._serialized_end=1036
-  _globals['_PRODUCTSERVICE']._serialized_start=1039
-  _globals['_PRODUCTSERVICE']._serialized_end=1549
-  _globals['_ORDERSERVICE']._serialized_start=1552
-  _globals['_ORDERSERVICE']._serialized_end=1896
+  _globals['_PRODUCTBATCH']._serialized_start=140
+  _globals['_PRODUCTBATCH']._serialized_end=189
+  _globals['_ORDER']._serialized_start=192
+  _globals['_ORDER']._serialized_end=495
+  _globals['_ORDER_ITEM']._serialized_start=337
+  _globals['_ORDER_ITEM']._serialized_end=405
+  _globals['_ORDER_STATUS']._serialized_start=407
+  _globals['_ORDER_STATUS']._serialized_end=495
+  _globals['_COUNTRESPONSE']._serialized_start=497
+  _globals['_COUNTRESPONSE']._serialized_end=527
+  _globals['_CREATEPRODUCTREQUEST']._serialized_start=529
+  _globals['_CREATEPRODUCTREQUEST']._serialized_end=601
+  _globals['_GETPRODUCTREQUEST']._serialized_start=603
+  _globals['_GETPRODUCTREQUEST']._serialized_end=642
+  _globals['_UPDATEPRODUCTREQUEST']._serialized_start=644
+  _globals['_UPDATEPRODUCTREQUEST']._serialized_end=736
+  _globals['_DELETEPRODUCTREQUEST']._serialized_start=738
+  _globals['_DELETEPRODUCTREQUEST']._serialized_end=780
+  _globals['_DELETEPRODUCTRESPONSE']._serialized_start=782
+  _globals['_DELETEPRODUCTRESPONSE']._serialized_end=822
+  _globals['_LISTPRODUCTSREQUEST']._serialized_start=824
+  _globals['_LISTPRODUCTSREQUEST']._serialized_end=845
+  _globals['_CREATEORDERREQUEST']._serialized_start=847
+  _globals['_CREATEORDERREQUEST']._serialized_end=922
+  _globals['_GETORDERREQUEST']._serialized_start=924
+  _globals['_GETORDERREQUEST']._serialized_end=959
+  _globals['_UPDATEORDERSTATUSREQUEST']._serialized_start=961
+  _globals['_UPDATEORDERSTATUSREQUEST']._serialized_end=1050
+  _globals['_PRODUCTSERVICE']._serialized_start=1053
+  _globals['_PRODUCTSERVICE']._serialized_end=1642
+  _globals['_ORDERSERVICE']._serialized_start=1645
+  _globals['_ORDERSERVICE']._serialized_end=1982
 # @@protoc_insertion_point(module_scope)
@@ -62,17 +62,22 @@ class ProductServiceStub(object):
         self.ListProducts = channel.unary_stream(
                 '/my_api.v1.ProductService/ListProducts',
                 request_serializer=order__api__pb2.ListProductsRequest.SerializeToString,
-                response_deserializer=order__api__pb2.Product.FromString,
+                response_deserializer=order__api__pb2.ProductBatch.FromString,
                 _registered_method=True)
         self.CountProducts = channel.unary_unary(
                 '/my_api.v1.ProductService/CountProducts',
                 request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
                 response_deserializer=order__api__pb2.CountResponse.FromString,
                 _registered_method=True)
-        self.ExportProducts = channel.unary_unary(
+        self.ExportProducts = channel.unary_stream(
                 '/my_api.v1.ProductService/ExportProducts',
                 request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
-                response_deserializer=order__api__pb2.ExportResponse.FromString,
+                response_deserializer=order__api__pb2.Product.FromString,
+                _registered_method=True)
+        self.ImportProducts = channel.stream_unary(
+                '/my_api.v1.ProductService/ImportProducts',
+                request_serializer=order__api__pb2.CreateProductRequest.SerializeToString,
+                response_deserializer=order__api__pb2.CountResponse.FromString,
                 _registered_method=True)
 
 
@@ -125,6 +130,12 @@ class ProductServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ImportProducts(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ProductServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -151,17 +162,22 @@ def add_ProductServiceServicer_to_server(servicer, server):
             'ListProducts': grpc.unary_stream_rpc_method_handler(
                     servicer.ListProducts,
                     request_deserializer=order__api__pb2.ListProductsRequest.FromString,
-                    response_serializer=order__api__pb2.Product.SerializeToString,
+                    response_serializer=order__api__pb2.ProductBatch.SerializeToString,
             ),
             'CountProducts': grpc.unary_unary_rpc_method_handler(
                     servicer.CountProducts,
                     request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                     response_serializer=order__api__pb2.CountResponse.SerializeToString,
             ),
-            'ExportProducts': grpc.unary_unary_rpc_method_handler(
+            'ExportProducts': grpc.unary_stream_rpc_method_handler(
                     servicer.ExportProducts,
                     request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
-                    response_serializer=order__api__pb2.ExportResponse.SerializeToString,
+                    response_serializer=order__api__pb2.Product.SerializeToString,
+            ),
+            'ImportProducts': grpc.stream_unary_rpc_method_handler(
+                    servicer.ImportProducts,
+                    request_deserializer=order__api__pb2.CreateProductRequest.FromString,
+                    response_serializer=order__api__pb2.CountResponse.SerializeToString,
             ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
@@ -302,7 +318,7 @@ class ProductService(object):
             target,
             '/my_api.v1.ProductService/ListProducts',
             order__api__pb2.ListProductsRequest.SerializeToString,
-            order__api__pb2.Product.FromString,
+            order__api__pb2.ProductBatch.FromString,
             options,
             channel_credentials,
             insecure,
@@ -351,12 +367,39 @@ class ProductService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(
+        return grpc.experimental.unary_stream(
             request,
             target,
             '/my_api.v1.ProductService/ExportProducts',
             google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
-            order__api__pb2.ExportResponse.FromString,
+            order__api__pb2.Product.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ImportProducts(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/my_api.v1.ProductService/ImportProducts',
+            order__api__pb2.CreateProductRequest.SerializeToString,
+            order__api__pb2.CountResponse.FromString,
             options,
             channel_credentials,
             insecure,
@@ -401,10 +444,10 @@ class OrderServiceStub(object):
                 request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
                 response_deserializer=order__api__pb2.CountResponse.FromString,
                 _registered_method=True)
-        self.ExportOrders = channel.unary_unary(
+        self.ExportOrders = channel.unary_stream(
                 '/my_api.v1.OrderService/ExportOrders',
                 request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
-                response_deserializer=order__api__pb2.ExportResponse.FromString,
+                response_deserializer=order__api__pb2.Order.FromString,
                 _registered_method=True)
 
 
@@ -468,10 +511,10 @@ def add_OrderServiceServicer_to_server(servicer, server):
                     request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                     response_serializer=order__api__pb2.CountResponse.SerializeToString,
             ),
-            'ExportOrders': grpc.unary_unary_rpc_method_handler(
+            'ExportOrders': grpc.unary_stream_rpc_method_handler(
                     servicer.ExportOrders,
                     request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
-                    response_serializer=order__api__pb2.ExportResponse.SerializeToString,
+                    response_serializer=order__api__pb2.Order.SerializeToString,
             ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
@@ -607,12 +650,12 @@ class OrderService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(
+        return grpc.experimental.unary_stream(
             request,
             target,
             '/my_api.v1.OrderService/ExportOrders',
             google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
-            order__api__pb2.ExportResponse.FromString,
+            order__api__pb2.Order.FromString,
             options,
             channel_credentials,
             insecure,
@@ -1,24 +1,67 @@
-import grpc
-import argparse
+import os
 import sys
 import json
-from google.protobuf import empty_pb2
+import orjson
+from contextlib import suppress
 
-# Assume the client library is installed or in the python path
-import order_api_pb2
-import order_api_pb2_grpc
+# gRPC and the generated modules are slow to import, so they are bound by
+# _load_grpc() only once a client is created; --help and argument errors
+# exit without paying for them.
+grpc = order_api_pb2 = order_api_pb2_grpc = None
+# Shared request for the parameter-less RPCs; it is never mutated.
+_EMPTY = None
+
+def _load_grpc():
+    """Imports gRPC and the generated API modules into this module's globals."""
+    global grpc, order_api_pb2, order_api_pb2_grpc, _EMPTY
+    import grpc
+    from google.protobuf import empty_pb2
+
+    # Assume the client library is installed or in the python path
+    import order_api_pb2
+    import order_api_pb2_grpc
+
+    if _EMPTY is None:
+        _EMPTY = empty_pb2.Empty()
+
+EXPORT_PATH = "products_export.json"
+
+TCP_TARGET = 'localhost:50051'
+# Socket the server also listens on; preferred when client and server share a host.
+UNIX_SOCKET_PATH = "/tmp/product.sock"
+
+# Mirrors the server's HTTP/2 tuning with a larger per-stream read-ahead window.
+CHANNEL_OPTIONS = [
+    ('grpc.http2.lookahead_bytes', 1 << 20),
+]
+
+def default_targets():
+    """Targets to try in order: the local server's Unix socket when it exists, then TCP.
+
+    The socket file can outlive a server that was killed, so TCP is always kept as a fallback.
+    """
+    if os.path.exists(UNIX_SOCKET_PATH):
+        return [f"unix:{UNIX_SOCKET_PATH}", TCP_TARGET]
+    return [TCP_TARGET]
 
 class ProductClient:
     """A resilient client for the ProductService gRPC API with error handling."""
-    def __init__(self, target='localhost:50051'):
+    def __init__(self, target=None):
+        _load_grpc()
         self.stub = None
-        try:
-            self.channel = grpc.insecure_channel(target)
-            grpc.channel_ready_future(self.channel).result(timeout=1)
+        targets = [target] if target else default_targets()
+        for candidate in targets:
+            channel = grpc.insecure_channel(candidate, options=CHANNEL_OPTIONS)
+            try:
+                grpc.channel_ready_future(channel).result(timeout=1)
+            except grpc.FutureTimeoutError:
+                channel.close()
+                continue
+            self.channel = channel
             self.stub = order_api_pb2_grpc.ProductServiceStub(self.channel)
-            print(f"🔌 Connected to gRPC server at {target}")
-        except grpc.FutureTimeoutError:
-            print(f"❌ Error: Could not connect to the server at {target}.", file=sys.stderr)
+            print(f"🔌 Connected to gRPC server at {candidate}")
+            return
+        print(f"❌ Error: Could not connect to the server at {' or '.join(targets)}.", file=sys.stderr)
 
     def _execute_rpc(self, rpc_call):
         """A helper to execute RPCs with built-in error handling."""
@@ -47,7 +90,8 @@ class ProductClient:
         print("--- Calling ListProducts ---")
         def rpc():
             # CORRECTED: Use Empty for parameter-less requests
-            return list(self.stub.ListProducts(empty_pb2.Empty()))
+            batches = self.stub.ListProducts(_EMPTY)
+            return [product for batch in batches for product in batch.items]
 
         response = self._execute_rpc(rpc)
         if response is not None:
@@ -92,7 +136,7 @@ class ProductClient:
         print("--- Calling CountProducts ---")
         def rpc():
             # CORRECTED: Use Empty for parameter-less requests
-            return self.stub.CountProducts(empty_pb2.Empty())
+            return self.stub.CountProducts(_EMPTY)
 
         response = self._execute_rpc(rpc)
         if response:
@@ -101,14 +145,35 @@ class ProductClient:
     def export_products(self, args):
         print("--- Calling ExportProducts ---")
         def rpc():
-            # CORRECTED: Use Empty for parameter-less requests
-            return self.stub.ExportProducts(empty_pb2.Empty())
+            # Write each product as it arrives rather than buffering the whole export.
+            # The stream goes to a temporary file that replaces the previous export
+            # only once it completes, so a failed call leaves the old file intact.
+            count = 0
+            tmp_path = EXPORT_PATH + ".tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(b"[")
+                    for product in self.stub.ExportProducts(_EMPTY):
+                        f.write(b",\n  " if count else b"\n  ")
+                        f.write(orjson.dumps({
+                            "product_id": product.product_id,
+                            "name": product.name,
+                            "description": product.description,
+                            "price": product.price,
+                        }))
+                        count += 1
+                    f.write(b"\n]\n" if count else b"]\n")
+                os.replace(tmp_path, EXPORT_PATH)
+            except BaseException:
+                # open() itself may have failed, leaving nothing to clean up
+                with suppress(FileNotFoundError):
+                    os.remove(tmp_path)
+                raise
+            return count
 
-        response = self._execute_rpc(rpc)
-        if response:
-            with open("products_export.json", "w", encoding="utf-8") as f:
-                f.write(response.json_data)
-            print("✅ All products exported to products_export.json")
+        count = self._execute_rpc(rpc)
+        if count is not None:
+            print(f"✅ Exported {count} products to {EXPORT_PATH}")
     
     def import_from_json(self, args):
         print(f"--- Importing products from {args.file} ---")
@@ -116,24 +181,24 @@ class ProductClient:
             with open(args.file, 'r', encoding='utf-8') as f:
                 products_to_import = json.load(f)
             
-            count = 0
-            for product in products_to_import:
-                # This lambda creates a unique request for each product in the loop
-                def rpc(p=product):
-                    request = order_api_pb2.CreateProductRequest(
+            def requests():
+                for p in products_to_import:
+                    yield order_api_pb2.CreateProductRequest(
                         name=p.get('name'),
                         description=p.get('description', ''),
                         price=p.get('price')
                     )
-                    return self.stub.CreateProduct(request)
 
-                response = self._execute_rpc(rpc)
-                if response:
-                    print(f"  -> Imported '{response.name}'")
-                    count += 1
-            
-            # CORRECTED: Moved the summary message outside the loop
-            print(f"\n✅ Successfully imported {count} products.")
+            def rpc():
+                # Stream every product over a single ImportProducts call
+                return self.stub.ImportProducts(requests(), compression=grpc.Compression.Gzip)
+
+            response = self._execute_rpc(rpc)
+            if response:
+                print(f"\n✅ Successfully imported {response.count} products.")
+                skipped = len(products_to_import) - response.count
+                if skipped:
+                    print(f"⚠️ Skipped {skipped} invalid products.")
 
         except FileNotFoundError:
             print(f"❌ Error: File not found at {args.file}", file=sys.stderr)
@@ -141,7 +206,12 @@ class ProductClient:
             print(f"❌ Error: Could not decode JSON from {args.file}", file=sys.stderr)
 
 def setup_parsers():
+    # Imported here so the no-argument fast path in main() never loads argparse
+    import argparse
     parser = argparse.ArgumentParser(description="A CLI tool to manage Products via gRPC.")
+    parser.add_argument("--target", type=str, default=None,
+                        help=f"Server address, e.g. {TCP_TARGET} or unix:{UNIX_SOCKET_PATH} "
+                             "(default: the local socket if present, then TCP)")
     subparsers = parser.add_subparsers(dest='command', required=True, help="Available commands")
 
     # Add command
@@ -176,10 +246,17 @@ def setup_parsers():
 
     return parser
 
+# Commands without options; main() dispatches these without building any parsers.
+NO_ARG_COMMANDS = ('list', 'count', 'export')
+
 def main():
-    parser = setup_parsers()
-    args = parser.parse_args()
-    client = ProductClient()
+    if len(sys.argv) == 2 and sys.argv[1] in NO_ARG_COMMANDS:
+        command, args, target = sys.argv[1], None, None
+    else:
+        parser = setup_parsers()
+        args = parser.parse_args()
+        command, target = args.command, args.target
+    client = ProductClient(target)
     
     if not client.stub:
         sys.exit(1)
@@ -194,11 +271,11 @@ def main():
         'import_json': client.import_from_json,
     }
 
-    func = command_functions.get(args.command)
+    func = command_functions.get(command)
     if func:
         func(args)
     else:
-        print(f"Unknown command: {args.command}", file=sys.stderr)
+        print(f"Unknown command: {command}", file=sys.stderr)
         sys.exit(1)
 
 if __name__ == '__main__':
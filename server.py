@@ -1,7 +1,9 @@
+import asyncio
 import grpc
+import os
 import sqlite3
-import uuid
-import json
+import secrets
+import threading
 from concurrent import futures
 from contextlib import contextmanager
 
@@ -10,15 +12,61 @@ import order_api_pb2_grpc
 from google.protobuf import empty_pb2
 
 DATABASE_NAME = "orders.db"
+# Local clients connect here instead of going through the TCP stack.
+UNIX_SOCKET_PATH = "/tmp/product.sock"
+# Number of rows handed to a single executemany() during a bulk import.
+IMPORT_BATCH_SIZE = 1000
+# Attempts at an import batch, re-minting its IDs after a product_id collision.
+IMPORT_ID_ATTEMPTS = 5
+# Products packed into each ProductBatch message streamed by ListProducts.
+LIST_BATCH_SIZE = 256
+# Worker threads that run the blocking SQLite calls for the asyncio server.
+DB_WORKERS = 4
+# HTTP/2 tuning so concurrent unary calls are not throttled by gRPC's defaults
+# (100 streams per connection and small flow-control windows).
+SERVER_OPTIONS = [
+    ('grpc.max_concurrent_streams', 1000),
+    ('grpc.http2.max_frame_size', 1 << 20),
+    ('grpc.http2.bdp_probe', 1),
+    ('grpc.keepalive_time_ms', 30000),
+]
+# Prepared statements each connection keeps in sqlite3's LRU cache.
+SQL_STATEMENT_CACHE_SIZE = 256
+
+# Fixed query text, so each statement is prepared once per connection and then
+# served from sqlite3's statement cache.
+_SQL_INSERT_PRODUCT = "INSERT INTO products (product_id, name, description, price) VALUES (?, ?, ?, ?)"
+# description is nullable; rows are unpacked straight into proto fields, which reject None.
+_SQL_GET_PRODUCT = "SELECT product_id, name, COALESCE(description, ''), price FROM products WHERE product_id = ?"
+_SQL_UPDATE_PRODUCT = "UPDATE products SET name=?, description=?, price=? WHERE product_id=?"
+_SQL_DELETE_PRODUCT = "DELETE FROM products WHERE product_id = ?"
+_SQL_LIST_PRODUCTS_PAGE = ("SELECT product_id, name, COALESCE(description, ''), price FROM products"
+                           " WHERE product_id > ? ORDER BY product_id LIMIT ?")
+_SQL_COUNT_PRODUCTS = "SELECT value FROM stats WHERE name = 'products'"
+_SQL_INSERT_ORDER = "INSERT INTO orders (order_id, user_id, status, total_amount) VALUES (?, ?, ?, ?)"
+_SQL_INSERT_ORDER_ITEM = "INSERT INTO order_items (order_id, product_id, quantity, price_per_item) VALUES (?, ?, ?, ?)"
+_SQL_GET_ORDER = "SELECT order_id, user_id, status, total_amount FROM orders WHERE order_id = ?"
+_SQL_GET_ORDER_ITEMS = "SELECT product_id, quantity, price_per_item FROM order_items WHERE order_id = ?"
+_SQL_UPDATE_ORDER_STATUS = "UPDATE orders SET status=? WHERE order_id=?"
+_SQL_COUNT_ORDERS = "SELECT value FROM stats WHERE name = 'orders'"
+_SQL_LIST_ORDERS = "SELECT order_id, user_id, status, total_amount FROM orders"
+_SQL_LIST_ORDER_ITEMS = "SELECT order_id, product_id, quantity, price_per_item FROM order_items"
+
+def new_id(prefix):
+    """Generates a short random ID such as 'prod-1a2b3c4d'."""
+    # 4 random bytes -> 8 hex chars, the same ID space as the old uuid4()[:8] slice
+    return f"{prefix}-{secrets.token_hex(4)}"
 
 class Database:
     """Manages all database operations for the API."""
     def __init__(self, db_name):
         self.db_name = db_name
+        self._local = threading.local()
         self._init_db()
 
     def _init_db(self):
-        with self._get_connection() as conn:
+        conn = self._connection()
+        with self._transaction(conn):
             cursor = conn.cursor()
             cursor.execute("""
             CREATE TABLE IF NOT EXISTS products (
@@ -36,109 +84,199 @@ class Database:
                 product_id TEXT NOT NULL, quantity INTEGER NOT NULL, price_per_item REAL NOT NULL,
                 FOREIGN KEY (order_id) REFERENCES orders (order_id)
             )""")
+            # Covers the item lookups, so they never touch the order_items table itself
+            cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_order_items_order
+                ON order_items (order_id, product_id, quantity, price_per_item)""")
+            # Row counts kept up to date by triggers, so counting is a single lookup
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS stats (
+                name TEXT PRIMARY KEY, value INTEGER NOT NULL DEFAULT 0
+            )""")
+            for table in ("products", "orders"):
+                cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {table} BEGIN
+                    UPDATE stats SET value = value + 1 WHERE name = '{table}';
+                END""")
+                cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {table} BEGIN
+                    UPDATE stats SET value = value - 1 WHERE name = '{table}';
+                END""")
+                # Seed from the existing rows the first time the counter is created
+                cursor.execute(f"INSERT OR IGNORE INTO stats (name, value) SELECT '{table}', COUNT(*) FROM {table}")
+
+    def _connection(self):
+        """Returns this thread's connection, opening and configuring it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode; multi-statement writes open their own transaction
+            # via _transaction(). Rows come back as plain tuples in the column
+            # order each query selects.
+            conn = sqlite3.connect(self.db_name, isolation_level=None,
+                                   cached_statements=SQL_STATEMENT_CACHE_SIZE)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self, conn):
+        """Groups statements on `conn` into one transaction, rolling back on error."""
+        # IMMEDIATE takes the write lock up front, so concurrent writers on other
+        # threads wait on the busy timeout instead of failing mid-transaction.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
 
     @contextmanager
-    def _get_connection(self):
-        """A context manager to handle database connections safely."""
-        conn = sqlite3.connect(self.db_name)
-        conn.row_factory = sqlite3.Row
+    def _bulk_mode(self, conn):
+        """Relaxes durability on `conn` for a bulk insert; a power loss may drop the latest batches."""
+        # journal_mode stays WAL: leaving WAL needs exclusive access to the database file.
+        # The connection outlives the import, so every other setting is put back afterwards.
+        bulk_settings = {"synchronous": "OFF", "temp_store": "MEMORY", "cache_size": "-200000"}
+        saved = {name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in bulk_settings}
+        for name, value in bulk_settings.items():
+            conn.execute(f"PRAGMA {name}={value}")
         try:
             yield conn
         finally:
-            conn.close()
+            for name, value in saved.items():
+                conn.execute(f"PRAGMA {name}={value}")
 
     # --- Product Methods ---
     def create_product(self, name, description, price):
-        product_id = "prod-" + str(uuid.uuid4())[:8]
-        with self._get_connection() as conn:
-            conn.execute("INSERT INTO products (product_id, name, description, price) VALUES (?, ?, ?, ?)",
-                         (product_id, name, description, price))
-            conn.commit() # CORRECTED: Added commit to save the new product
+        product_id = new_id("prod")
+        conn = self._connection()
+        conn.execute(_SQL_INSERT_PRODUCT, (product_id, name, description, price))
         return self.get_product(product_id)
 
     def get_product(self, product_id):
-        with self._get_connection() as conn:
-            return conn.execute("SELECT * FROM products WHERE product_id = ?", (product_id,)).fetchone()
+        conn = self._connection()
+        return conn.execute(_SQL_GET_PRODUCT, (product_id,)).fetchone()
 
     def update_product(self, product_id, name, description, price):
-        with self._get_connection() as conn:
-            cursor = conn.execute("UPDATE products SET name=?, description=?, price=? WHERE product_id=?",
-                                  (name, description, price, product_id))
-            conn.commit() 
-            if cursor.rowcount == 0:
-                return None
+        conn = self._connection()
+        cursor = conn.execute(_SQL_UPDATE_PRODUCT, (name, description, price, product_id))
+        if cursor.rowcount == 0:
+            return None
         return self.get_product(product_id)
 
     def delete_product(self, product_id):
-        with self._get_connection() as conn:
-            cursor = conn.execute("DELETE FROM products WHERE product_id = ?", (product_id,))
-            conn.commit()
-            return cursor.rowcount > 0
+        conn = self._connection()
+        cursor = conn.execute(_SQL_DELETE_PRODUCT, (product_id,))
+        return cursor.rowcount > 0
 
-    def list_products(self):
-        with self._get_connection() as conn:
-            return conn.execute("SELECT * FROM products").fetchall()
+    def list_products_page(self, after_id, limit):
+        """Returns up to `limit` product rows with product_id greater than `after_id`, in ID order."""
+        conn = self._connection()
+        return conn.execute(_SQL_LIST_PRODUCTS_PAGE, (after_id, limit)).fetchall()
 
     def count_products(self):
-        with self._get_connection() as conn:
-            return conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+        conn = self._connection()
+        return conn.execute(_SQL_COUNT_PRODUCTS).fetchone()[0]
 
-    def export_products(self):
-        with self._get_connection() as conn:
-            rows = conn.execute("SELECT * FROM products").fetchall()
-            return json.dumps([dict(row) for row in rows], indent=2)
+    def bulk_create_products(self, rows):
+        """Inserts (product_id, name, description, price) tuples in a single transaction."""
+        conn = self._connection()
+        with self._bulk_mode(conn), self._transaction(conn):
+            conn.executemany(_SQL_INSERT_PRODUCT, rows)
 
     # --- Order Methods ---
     def create_order(self, user_id, items):
-        order_id = "order-" + str(uuid.uuid4())[:8]
+        order_id = new_id("order")
         total_amount = sum(item.quantity * item.price_per_item for item in items)
-        with self._get_connection() as conn:
-            conn.execute("INSERT INTO orders (order_id, user_id, status, total_amount) VALUES (?, ?, ?, ?)",
-                           (order_id, user_id, order_api_pb2.Order.PENDING, total_amount))
-            for item in items:
-                conn.execute("INSERT INTO order_items (order_id, product_id, quantity, price_per_item) VALUES (?, ?, ?, ?)",
-                               (order_id, item.product_id, item.quantity, item.price_per_item))
-            conn.commit() 
+        conn = self._connection()
+        with self._transaction(conn):
+            conn.execute(_SQL_INSERT_ORDER, (order_id, user_id, order_api_pb2.Order.PENDING, total_amount))
+            conn.executemany(_SQL_INSERT_ORDER_ITEM,
+                             [(order_id, item.product_id, item.quantity, item.price_per_item) for item in items])
         return self.get_order(order_id)
 
     def get_order(self, order_id):
-        with self._get_connection() as conn:
-            order_data = conn.execute("SELECT * FROM orders WHERE order_id = ?", (order_id,)).fetchone()
-            if not order_data:
-                return None, []
-            items_data = conn.execute("SELECT * FROM order_items WHERE order_id = ?", (order_id,)).fetchall()
-            return order_data, items_data
+        conn = self._connection()
+        order_data = conn.execute(_SQL_GET_ORDER, (order_id,)).fetchone()
+        if not order_data:
+            return None, []
+        items_data = conn.execute(_SQL_GET_ORDER_ITEMS, (order_id,)).fetchall()
+        return order_data, items_data
     
     def update_order_status(self, order_id, new_status):
-        with self._get_connection() as conn:
-            cursor = conn.execute("UPDATE orders SET status=? WHERE order_id=?", (new_status, order_id))
-            conn.commit() 
-            if cursor.rowcount == 0:
-                return None, []
+        conn = self._connection()
+        cursor = conn.execute(_SQL_UPDATE_ORDER_STATUS, (new_status, order_id))
+        if cursor.rowcount == 0:
+            return None, []
         return self.get_order(order_id)
         
     def count_orders(self):
-        with self._get_connection() as conn:
-            return conn.execute("SELECT COUNT(*) FROM orders").fetchone()[0]
+        conn = self._connection()
+        return conn.execute(_SQL_COUNT_ORDERS).fetchone()[0]
 
     def export_orders(self):
-        with self._get_connection() as conn:
-            orders_rows = conn.execute("SELECT * FROM orders").fetchall()
-            items_rows = conn.execute("SELECT * FROM order_items").fetchall()
-        
-        orders_list = []
-        for order_row in orders_rows:
-            order_dict = dict(order_row)
-            order_dict['items'] = [dict(item_row) for item_row in items_rows if item_row['order_id'] == order_dict['order_id']]
-            orders_list.append(order_dict)
-        return json.dumps(orders_list, indent=2)
+        """Returns (order_row, item_rows) pairs for every order."""
+        conn = self._connection()
+        orders_rows = conn.execute(_SQL_LIST_ORDERS).fetchall()
+        items_rows = conn.execute(_SQL_LIST_ORDER_ITEMS).fetchall()
+
+        # Group items by order in one pass instead of rescanning them per order
+        items_by_order = {}
+        for order_id, *item_row in items_rows:
+            items_by_order.setdefault(order_id, []).append(item_row)
+
+        return [(order_row, items_by_order.get(order_row[0], [])) for order_row in orders_rows]
+
+
+async def run_blocking(executor, func, *args):
+    """Runs a blocking Database call on `executor` without stalling the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+async def product_pages(executor, db, page_size):
+    """Async-iterates all product rows in pages of up to `page_size`, in product_id order.
+
+    Each page is a separate short query on `executor`, so no worker thread or
+    read snapshot is held while the caller waits on the network. The next page
+    is fetched while the caller sends the current one.
+    """
+    page = await run_blocking(executor, db.list_products_page, "", page_size)
+    while page:
+        next_page = asyncio.ensure_future(run_blocking(executor, db.list_products_page, page[-1][0], page_size))
+        try:
+            yield page
+        except BaseException:
+            next_page.cancel()
+            raise
+        page = await next_page
+
+
+def product_from_row(row):
+    """Builds a Product from a (product_id, name, description, price) row."""
+    product = order_api_pb2.Product()
+    product.product_id, product.name, product.description, product.price = row
+    return product
+
+
+def order_from_rows(order_row, item_rows):
+    """Builds an Order from an (order_id, user_id, status, total_amount) row and its
+    (product_id, quantity, price_per_item) item rows."""
+    order = order_api_pb2.Order()
+    order.order_id, order.user_id, order.status, order.total_amount = order_row
+    for item_row in item_rows:
+        item = order.items.add()
+        item.product_id, item.quantity, item.price_per_item = item_row
+    return order
 
 
 class ProductServiceServicer(order_api_pb2_grpc.ProductServiceServicer):
-    def __init__(self, db):
+    def __init__(self, db, executor):
         self.db = db
+        self.executor = executor
 
-    def CreateProduct(self, request, context):
+    async def CreateProduct(self, request, context):
         # Basic validation
         if not request.name:
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
@@ -149,90 +287,152 @@ class ProductServiceServicer(order_api_pb2_grpc.ProductServiceServicer):
             context.set_details("Price must be greater than zero.")
             return order_api_pb2.Product()
         
-        row = self.db.create_product(request.name, request.description, request.price)
-        return order_api_pb2.Product(**row)
+        row = await run_blocking(self.executor, self.db.create_product,
+                                 request.name, request.description, request.price)
+        return product_from_row(row)
 
     # ... (rest of ProductServiceServicer methods are correct) ...
-    def GetProduct(self, request, context):
-        row = self.db.get_product(request.product_id)
+    async def GetProduct(self, request, context):
+        row = await run_blocking(self.executor, self.db.get_product, request.product_id)
         if not row:
             context.set_code(grpc.StatusCode.NOT_FOUND); context.set_details("Product not found.")
             return order_api_pb2.Product()
-        return order_api_pb2.Product(**row)
+        return product_from_row(row)
 
-    def UpdateProduct(self, request, context):
-        row = self.db.update_product(request.product_id, request.name, request.description, request.price)
+    async def UpdateProduct(self, request, context):
+        row = await run_blocking(self.executor, self.db.update_product,
+                                 request.product_id, request.name, request.description, request.price)
         if not row:
             context.set_code(grpc.StatusCode.NOT_FOUND); context.set_details("Product not found to update.")
             return order_api_pb2.Product()
-        return order_api_pb2.Product(**row)
+        return product_from_row(row)
 
-    def DeleteProduct(self, request, context):
-        success = self.db.delete_product(request.product_id)
+    async def DeleteProduct(self, request, context):
+        success = await run_blocking(self.executor, self.db.delete_product, request.product_id)
         return order_api_pb2.DeleteProductResponse(success=success)
 
-    def ListProducts(self, request, context):
-        for row in self.db.list_products():
-            yield order_api_pb2.Product(**row)
-
-    def CountProducts(self, request, context):
-        count = self.db.count_products()
+    async def ListProducts(self, request, context):
+        context.set_compression(grpc.Compression.Gzip)
+        async for rows in product_pages(self.executor, self.db, LIST_BATCH_SIZE):
+            batch = order_api_pb2.ProductBatch()
+            for row in rows:
+                product = batch.items.add()
+                product.product_id, product.name, product.description, product.price = row
+            yield batch
+
+    async def CountProducts(self, request, context):
+        count = await run_blocking(self.executor, self.db.count_products)
         return order_api_pb2.CountResponse(count=count)
     
-    def ExportProducts(self, request, context):
-        json_data = self.db.export_products()
-        return order_api_pb2.ExportResponse(json_data=json_data)
+    async def ExportProducts(self, request, context):
+        context.set_compression(grpc.Compression.Gzip)
+        async for rows in product_pages(self.executor, self.db, LIST_BATCH_SIZE):
+            for row in rows:
+                yield product_from_row(row)
+
+    async def _import_batch(self, batch):
+        """Inserts one import batch, re-minting its IDs if any collides with an existing product."""
+        for attempt in range(IMPORT_ID_ATTEMPTS):
+            try:
+                return await run_blocking(self.executor, self.db.bulk_create_products, batch)
+            except sqlite3.IntegrityError:
+                # The batch was rolled back, so it can be retried as a whole
+                if attempt == IMPORT_ID_ATTEMPTS - 1:
+                    raise
+                batch = [(new_id("prod"), *row[1:]) for row in batch]
+
+    async def ImportProducts(self, request_iterator, context):
+        count = 0
+        batch = []
+        try:
+            async for request in request_iterator:
+                # Invalid entries are skipped, mirroring CreateProduct's validation.
+                if not request.name or request.price <= 0:
+                    continue
+                batch.append((new_id("prod"), request.name, request.description, request.price))
+                if len(batch) >= IMPORT_BATCH_SIZE:
+                    await self._import_batch(batch)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                await self._import_batch(batch)
+                count += len(batch)
+        except sqlite3.Error as e:
+            # Earlier batches are already committed; say how many so a rerun can skip them.
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Import stopped after {count} products were committed: {e}")
+        return order_api_pb2.CountResponse(count=count)
 
 
 class OrderServiceServicer(order_api_pb2_grpc.OrderServiceServicer):
-    def __init__(self, db):
+    def __init__(self, db, executor):
         self.db = db
+        self.executor = executor
 
-    def CreateOrder(self, request, context):
-        order_row, item_rows = self.db.create_order(request.user_id, request.items)
+    async def CreateOrder(self, request, context):
+        order_row, item_rows = await run_blocking(self.executor, self.db.create_order,
+                                                  request.user_id, request.items)
         if not order_row:
              context.set_code(grpc.StatusCode.INTERNAL)
              context.set_details("Failed to create order.")
              return order_api_pb2.Order()
-        items = [order_api_pb2.Order.Item(**item) for item in item_rows]
-        return order_api_pb2.Order(**order_row, items=items)
+        return order_from_rows(order_row, item_rows)
 
-    def GetOrder(self, request, context):
-        order_row, item_rows = self.db.get_order(request.order_id)
+    async def GetOrder(self, request, context):
+        order_row, item_rows = await run_blocking(self.executor, self.db.get_order, request.order_id)
         if not order_row:
             context.set_code(grpc.StatusCode.NOT_FOUND); context.set_details("Order not found.")
             return order_api_pb2.Order()
-        items = [order_api_pb2.Order.Item(**item) for item in item_rows]
-        return order_api_pb2.Order(**order_row, items=items)
+        return order_from_rows(order_row, item_rows)
 
-    def UpdateOrderStatus(self, request, context):
-        order_row, item_rows = self.db.update_order_status(request.order_id, request.new_status)
+    async def UpdateOrderStatus(self, request, context):
+        order_row, item_rows = await run_blocking(self.executor, self.db.update_order_status,
+                                                  request.order_id, request.new_status)
         if not order_row:
             context.set_code(grpc.StatusCode.NOT_FOUND); context.set_details("Order not found to update.")
             return order_api_pb2.Order()
-        items = [order_api_pb2.Order.Item(**item) for item in item_rows]
-        return order_api_pb2.Order(**order_row, items=items)
+        return order_from_rows(order_row, item_rows)
         
-    def CountOrders(self, request, context):
-        count = self.db.count_orders()
+    async def CountOrders(self, request, context):
+        count = await run_blocking(self.executor, self.db.count_orders)
         return order_api_pb2.CountResponse(count=count)
 
-    def ExportOrders(self, request, context):
-        json_data = self.db.export_orders()
-        return order_api_pb2.ExportResponse(json_data=json_data)
+    async def ExportOrders(self, request, context):
+        context.set_compression(grpc.Compression.Gzip)
+        for order_row, item_rows in await run_blocking(self.executor, self.db.export_orders):
+            yield order_from_rows(order_row, item_rows)
 
 
-def serve():
+async def serve():
     db = Database(DATABASE_NAME)
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    executor = futures.ThreadPoolExecutor(max_workers=DB_WORKERS)
+    # Only the bulk streaming RPCs opt into gzip (see set_compression calls);
+    # small unary responses are left uncompressed.
+    server = grpc.aio.server(options=SERVER_OPTIONS)
     
-    order_api_pb2_grpc.add_ProductServiceServicer_to_server(ProductServiceServicer(db), server)
-    order_api_pb2_grpc.add_OrderServiceServicer_to_server(OrderServiceServicer(db), server)
+    order_api_pb2_grpc.add_ProductServiceServicer_to_server(ProductServiceServicer(db, executor), server)
+    order_api_pb2_grpc.add_OrderServiceServicer_to_server(OrderServiceServicer(db, executor), server)
     
     server.add_insecure_port('[::]:50051')
-    server.start()
+    unix_listening = False
+    if os.name == "posix":
+        try:
+            server.add_insecure_port(f"unix:{UNIX_SOCKET_PATH}")
+            unix_listening = True
+        except RuntimeError:
+            # e.g. the path is held by another user's socket; TCP still works
+            print(f"⚠️ Could not listen on {UNIX_SOCKET_PATH}; serving TCP only.")
+    await server.start()
+    if unix_listening:
+        # Connecting needs write permission; match the TCP port, which any local user can reach
+        os.chmod(UNIX_SOCKET_PATH, 0o666)
     print("✅ Server started. Listening on port 50051.")
-    server.wait_for_termination()
+    try:
+        await server.wait_for_termination()
+    finally:
+        # A graceful stop removes the Unix socket file; a killed server leaves it
+        # behind, which is why the CLI falls back to TCP.
+        await server.stop(None)
 
 if __name__ == '__main__':
-    serve()
\ No newline at end of file
+    asyncio.run(serve())
\ No newline at end of file